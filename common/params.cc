@@ -2,6 +2,7 @@
 
 #include <dirent.h>
 #include <sys/file.h>
+#include <sys/stat.h>
 
 #include <algorithm>
 #include <cassert>
@@ -398,6 +399,23 @@ std::vector<std::string> Params::allKeys() const {
   return ret;
 }
 
+std::vector<std::string> Params::existingKeys() {
+  std::vector<std::string> ret;
+  if (DIR *d = opendir(getParamPath().c_str())) {
+    struct dirent *de = NULL;
+    while ((de = readdir(d))) {
+      // An empty value reads back as unset from get(), so don't report it either
+      struct stat st;
+      if (de->d_type != DT_DIR && checkKey(de->d_name) &&
+          fstatat(dirfd(d), de->d_name, &st, 0) == 0 && st.st_size > 0) {
+        ret.push_back(de->d_name);
+      }
+    }
+    closedir(d);
+  }
+  return ret;
+}
+
 bool Params::checkKey(const std::string &key) {
   return keys.find(key) != keys.end();
 }
@@ -443,6 +461,53 @@ int Params::put(const char* key, const char* value, size_t value_size) {
   return result;
 }
 
+int Params::putMany(const std::map<std::string, std::string> &values) {
+  // Same steps as put(), but every value is moved into place under a
+  // single lock and the containing directory is only fsynced once.
+  if (values.empty()) return 0;
+
+  std::vector<std::pair<std::string, std::string>> tmp_paths;
+  int result = 0;
+  for (const auto &[key, value] : values) {
+    std::string tmp_path = params_path + "/.tmp_value_XXXXXX";
+    int tmp_fd = mkstemp((char*)tmp_path.c_str());
+    if (tmp_fd < 0) {
+      result = -1;
+      break;
+    }
+    tmp_paths.push_back({tmp_path, key});
+
+    // Write value to temp and fsync to force persist the changes.
+    ssize_t bytes_written = HANDLE_EINTR(write(tmp_fd, value.data(), value.size()));
+    if (bytes_written < 0 || (size_t)bytes_written != value.size()) {
+      result = -20;
+    } else {
+      result = fsync(tmp_fd);
+    }
+    close(tmp_fd);
+    if (result < 0) break;
+  }
+
+  if (result == 0) {
+    FileLock file_lock(params_path + "/.lock");
+
+    // Move temps into place.
+    for (const auto &[tmp_path, key] : tmp_paths) {
+      if ((result = rename(tmp_path.c_str(), getParamPath(key).c_str())) < 0) break;
+    }
+
+    // fsync parent directory
+    if (result == 0) {
+      result = fsync_dir(getParamPath());
+    }
+  }
+
+  for (const auto &[tmp_path, key] : tmp_paths) {
+    ::unlink(tmp_path.c_str());
+  }
+  return result;
+}
+
 int Params::remove(const std::string &key) {
   FileLock file_lock(params_path + "/.lock");
   int result = unlink(getParamPath(key).c_str());
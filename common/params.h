@@ -28,6 +28,7 @@ public:
   Params& operator=(const Params&) = delete;
 
   std::vector<std::string> allKeys() const;
+  std::vector<std::string> existingKeys();
   bool checkKey(const std::string &key);
   ParamKeyType getKeyType(const std::string &key);
   inline std::string getParamPath(const std::string &key = {}) {
@@ -58,6 +59,7 @@ public:
   inline int put(const std::string &key, const std::string &val) {
     return put(key.c_str(), val.data(), val.size());
   }
+  int putMany(const std::map<std::string, std::string> &values);
   inline int putBool(const std::string &key, bool val) {
     return put(key.c_str(), val ? "1" : "0", 1);
   }
@@ -1,6 +1,7 @@
 # distutils: language = c++
 # cython: language_level = 3
 from libcpp cimport bool
+from libcpp.map cimport map
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
@@ -21,6 +22,7 @@ cdef extern from "common/params.h":
     float getFloat(string, bool) nogil
     int remove(string) nogil
     int put(string, string) nogil
+    int putMany(map[string, string]) nogil
     void putNonBlocking(string, string) nogil
     void putBoolNonBlocking(string, bool) nogil
     void putIntNonBlocking(string, int) nogil
@@ -32,6 +34,7 @@ cdef extern from "common/params.h":
     string getParamPath(string) nogil
     void clearAll(ParamKeyType)
     vector[string] allKeys()
+    vector[string] existingKeys() nogil
 
 
 def ensure_bytes(v):
@@ -76,6 +79,13 @@ cdef class Params:
 
     return val if encoding is None else val.decode(encoding)
 
+  def get_many(self, keys, encoding=None):
+    """
+    Convenience wrapper returning a dict of key -> get(key, encoding=encoding).
+    Unlike put_many this is not batched, every key is a separate get().
+    """
+    return {key: self.get(key, encoding=encoding) for key in keys}
+
   def get_bool(self, key, bool block=False):
     cdef string k = self.check_key(key)
     cdef bool r
@@ -83,6 +93,19 @@ cdef class Params:
       r = self.p.getBool(k, block)
     return r
 
+  def get_bools(self, keys):
+    """
+    Reads several bool params with a single call into C++,
+    returns a list with one bool per key.
+    """
+    cdef vector[string] ks = [self.check_key(key) for key in keys]
+    cdef vector[int] r
+    cdef size_t i
+    with nogil:
+      for i in range(ks.size()):
+        r.push_back(self.p.getBool(ks[i], False))
+    return [bool(v) for v in r]
+
   def get_int(self, key, bool block=False):
     cdef string k = self.check_key(key)
     cdef int r
@@ -109,6 +132,18 @@ cdef class Params:
     with nogil:
       self.p.put(k, dat_bytes)
 
+  def put_many(self, values):
+    """
+    Writes all key/value pairs in values, taking the params lock and
+    syncing the params directory once instead of once per key.
+    Like put, this blocks until everything is written to disk.
+    """
+    cdef map[string, string] c_values
+    for key, dat in values.items():
+      c_values[self.check_key(key)] = ensure_bytes(dat)
+    with nogil:
+      self.p.putMany(c_values)
+
   def put_bool(self, key, bool val):
     cdef string k = self.check_key(key)
     with nogil:
@@ -156,3 +191,14 @@ cdef class Params:
 
   def all_keys(self):
     return self.p.allKeys()
+
+  def existing_keys(self):
+    """
+    Returns the set of keys that currently have a non-empty value, from a
+    single scan of the params directory. Keys whose value is empty are left
+    out, matching get() returning None for them.
+    """
+    cdef vector[string] keys
+    with nogil:
+      keys = self.p.existingKeys()
+    return {k.decode() for k in keys}
@@ -1,39 +1,63 @@
 import numpy as np
 
-from openpilot.common.numpy_fast import interp
+from bisect import bisect_right
+
 from openpilot.common.params import Params
 
 params = Params()
 params_memory = Params("/dev/shm/params")
 
-class FrogPilotFunctions:
-  # Acceleration profiles - Credit goes to the DragonPilot team!
-                   # MPH = [0.,  35,   35,  40,    40,  45,    45,  67,    67,   67, 123]
-  A_CRUISE_MIN_BP_CUSTOM = [0., 2.0, 2.01, 11., 11.01, 18., 18.01, 28., 28.01,  33., 55.]
-                   # MPH = [0., 6.71, 13.4, 17.9, 24.6, 33.6, 44.7, 55.9, 67.1, 123]
-  A_CRUISE_MAX_BP_CUSTOM = [0.,    3,   6.,   8.,  11.,  15.,  20.,  25.,  30., 55.]
+# Acceleration profiles - Credit goes to the DragonPilot team!
+                 # MPH = [0.,  35,   35,  40,    40,  45,    45,  67,    67,   67, 123]
+A_CRUISE_MIN_BP_CUSTOM = [0., 2.0, 2.01, 11., 11.01, 18., 18.01, 28., 28.01,  33., 55.]
+                 # MPH = [0., 6.71, 13.4, 17.9, 24.6, 33.6, 44.7, 55.9, 67.1, 123]
+A_CRUISE_MAX_BP_CUSTOM = [0.,    3,   6.,   8.,  11.,  15.,  20.,  25.,  30., 55.]
 
-  A_CRUISE_MIN_VALS_ECO = [-0.480, -0.480, -0.40, -0.40, -0.40, -0.36, -0.32, -0.28, -0.28, -0.25, -0.25]
-  A_CRUISE_MAX_VALS_ECO = [3.5, 3.3, 1.7, 1.1, .76, .62, .47, .36, .28, .09]
+A_CRUISE_MIN_VALS_ECO = [-0.480, -0.480, -0.40, -0.40, -0.40, -0.36, -0.32, -0.28, -0.28, -0.25, -0.25]
+A_CRUISE_MAX_VALS_ECO = [3.5, 3.3, 1.7, 1.1, .76, .62, .47, .36, .28, .09]
 
-  A_CRUISE_MIN_VALS_SPORT = [-0.500, -0.500, -0.42, -0.42, -0.42, -0.42, -0.40, -0.35, -0.35, -0.30, -0.30]
-  A_CRUISE_MAX_VALS_SPORT = [3.5, 3.5, 3.0, 2.6, 1.4, 1.0, 0.7, 0.6, .38, .2]
+A_CRUISE_MIN_VALS_SPORT = [-0.500, -0.500, -0.42, -0.42, -0.42, -0.42, -0.40, -0.35, -0.35, -0.30, -0.30]
+A_CRUISE_MAX_VALS_SPORT = [3.5, 3.5, 3.0, 2.6, 1.4, 1.0, 0.7, 0.6, .38, .2]
 
-  @staticmethod
-  def get_min_accel_eco(v_ego):
-    return interp(v_ego, FrogPilotFunctions.A_CRUISE_MIN_BP_CUSTOM, FrogPilotFunctions.A_CRUISE_MIN_VALS_ECO)
+def _build_segment_table(bp, vals):
+  # Precompute the slope and intercept of every segment so a lookup is a bisect and a multiply-add
+  slopes = tuple((vals[i + 1] - vals[i]) / (bp[i + 1] - bp[i]) for i in range(len(bp) - 1))
+  intercepts = tuple(vals[i] - slopes[i] * bp[i] for i in range(len(bp) - 1))
+  return tuple(bp), tuple(vals), slopes, intercepts
 
-  @staticmethod
-  def get_max_accel_eco(v_ego):
-    return interp(v_ego, FrogPilotFunctions.A_CRUISE_MAX_BP_CUSTOM, FrogPilotFunctions.A_CRUISE_MAX_VALS_ECO)
+def _segment_interp(x, table):
+  bp, vals, slopes, intercepts = table
+  # Same results as numpy_fast.interp, including NaN giving the first value and inf the edge values
+  if not x > bp[0]:
+    return vals[0]
+  if x >= bp[-1]:
+    return vals[-1]
+  i = bisect_right(bp, x) - 1
+  return slopes[i] * x + intercepts[i]
 
-  @staticmethod
-  def get_min_accel_sport(v_ego):
-    return interp(v_ego, FrogPilotFunctions.A_CRUISE_MIN_BP_CUSTOM, FrogPilotFunctions.A_CRUISE_MIN_VALS_SPORT)
+_MIN_ACCEL_ECO = _build_segment_table(A_CRUISE_MIN_BP_CUSTOM, A_CRUISE_MIN_VALS_ECO)
+_MAX_ACCEL_ECO = _build_segment_table(A_CRUISE_MAX_BP_CUSTOM, A_CRUISE_MAX_VALS_ECO)
+_MIN_ACCEL_SPORT = _build_segment_table(A_CRUISE_MIN_BP_CUSTOM, A_CRUISE_MIN_VALS_SPORT)
+_MAX_ACCEL_SPORT = _build_segment_table(A_CRUISE_MAX_BP_CUSTOM, A_CRUISE_MAX_VALS_SPORT)
 
-  @staticmethod
-  def get_max_accel_sport(v_ego):
-    return interp(v_ego, FrogPilotFunctions.A_CRUISE_MAX_BP_CUSTOM, FrogPilotFunctions.A_CRUISE_MAX_VALS_SPORT)
+def get_min_accel_eco(v_ego):
+  return _segment_interp(v_ego, _MIN_ACCEL_ECO)
+
+def get_max_accel_eco(v_ego):
+  return _segment_interp(v_ego, _MAX_ACCEL_ECO)
+
+def get_min_accel_sport(v_ego):
+  return _segment_interp(v_ego, _MIN_ACCEL_SPORT)
+
+def get_max_accel_sport(v_ego):
+  return _segment_interp(v_ego, _MAX_ACCEL_SPORT)
+
+class FrogPilotFunctions:
+  # Kept for existing callers, hot paths should import the module level functions
+  get_min_accel_eco = staticmethod(get_min_accel_eco)
+  get_max_accel_eco = staticmethod(get_max_accel_eco)
+  get_min_accel_sport = staticmethod(get_min_accel_sport)
+  get_max_accel_sport = staticmethod(get_max_accel_sport)
 
   @staticmethod
   def calculate_lane_width(lane, current_lane, road_edge):
@@ -6,7 +6,8 @@ from openpilot.common.numpy_fast import clip
 from openpilot.selfdrive.controls.lib.desire_helper import LANE_CHANGE_SPEED_MIN
 from openpilot.selfdrive.controls.lib.longitudinal_planner import A_CRUISE_MIN, A_CRUISE_MAX_BP, get_max_accel
 
-from openpilot.selfdrive.frogpilot.functions.frogpilot_functions import FrogPilotFunctions
+from openpilot.selfdrive.frogpilot.functions.frogpilot_functions import FrogPilotFunctions, get_min_accel_eco, get_max_accel_eco, \
+                                                                     get_min_accel_sport, get_max_accel_sport
 
 from openpilot.selfdrive.frogpilot.functions.conditional_experimental_mode import ConditionalExperimentalMode
 from openpilot.selfdrive.frogpilot.functions.map_turn_speed_controller import MapTurnSpeedController
@@ -43,9 +44,9 @@ class FrogPilotPlanner:
     if v_cruise_changed:
       self.accel_limits = [A_CRUISE_MIN, get_max_accel(v_ego)]
     elif self.acceleration_profile == 1:
-      self.accel_limits = [FrogPilotFunctions.get_min_accel_eco(v_ego), FrogPilotFunctions.get_max_accel_eco(v_ego)]
+      self.accel_limits = [get_min_accel_eco(v_ego), get_max_accel_eco(v_ego)]
     elif self.acceleration_profile in (2, 3):
-      self.accel_limits = [FrogPilotFunctions.get_min_accel_sport(v_ego), FrogPilotFunctions.get_max_accel_sport(v_ego)]
+      self.accel_limits = [get_min_accel_sport(v_ego), get_max_accel_sport(v_ego)]
     else:
       self.accel_limits = [A_CRUISE_MIN, get_max_accel(v_ego)]
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import math
+import unittest
+
+from openpilot.common.numpy_fast import interp
+import openpilot.selfdrive.frogpilot.functions.frogpilot_functions as ff
+
+ACCEL_PROFILES = [
+  (ff.FrogPilotFunctions.get_min_accel_eco, ff.A_CRUISE_MIN_BP_CUSTOM, ff.A_CRUISE_MIN_VALS_ECO),
+  (ff.FrogPilotFunctions.get_max_accel_eco, ff.A_CRUISE_MAX_BP_CUSTOM, ff.A_CRUISE_MAX_VALS_ECO),
+  (ff.FrogPilotFunctions.get_min_accel_sport, ff.A_CRUISE_MIN_BP_CUSTOM, ff.A_CRUISE_MIN_VALS_SPORT),
+  (ff.FrogPilotFunctions.get_max_accel_sport, ff.A_CRUISE_MAX_BP_CUSTOM, ff.A_CRUISE_MAX_VALS_SPORT),
+]
+
+
+class TestAccelProfiles(unittest.TestCase):
+  def test_matches_interp(self):
+    speeds = [i * 0.005 for i in range(-1000, 14000)]
+    for getter, bp, vals in ACCEL_PROFILES:
+      for v_ego in speeds + list(bp):
+        self.assertAlmostEqual(getter(v_ego), interp(v_ego, bp, vals), places=9, msg=f"{getter.__name__}({v_ego})")
+
+  def test_bad_inputs(self):
+    for getter, bp, vals in ACCEL_PROFILES:
+      for v_ego in (math.nan, math.inf, -math.inf):
+        self.assertEqual(getter(v_ego), interp(v_ego, bp, vals), msg=f"{getter.__name__}({v_ego})")
+
+
+if __name__ == "__main__":
+  unittest.main()
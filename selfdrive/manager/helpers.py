@@ -1,15 +1,19 @@
 import os
 import sys
+import ctypes
 import fcntl
 import errno
 import signal
 import shutil
+import struct
 import subprocess
 import tempfile
 import threading
+from typing import Iterable
 
 from openpilot.common.basedir import BASEDIR
 from openpilot.common.params import Params
+from openpilot.common.swaglog import cloudlog
 
 def unblock_stdout() -> None:
   # get a non-blocking stdout
@@ -62,3 +66,76 @@ def save_bootlog():
   t = threading.Thread(target=fn, args=(tmp, ))
   t.daemon = True
   t.start()
+
+
+IN_MOVED_TO = 0x80
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class ParamsWatcher:
+  """Tells whether any of keys may have changed since the last check, using an inotify
+  watch on the params directory. Without inotify, or once the watch stops, every check
+  reports a change so callers fall back to polling. Every recheck_ticks checks also
+  report a change regardless, as a backstop against missed events."""
+  def __init__(self, params: Params, keys: Iterable[str], recheck_ticks: int):
+    self.keys = set(keys)
+    self.recheck_ticks = recheck_ticks
+    self.ticks = 0
+    self.watching = False
+
+    # Starts out set so the first check always reads the params
+    self.changed = threading.Event()
+    self.changed.set()
+
+    try:
+      libc = ctypes.CDLL(None, use_errno=True)
+      fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (AttributeError, OSError):
+      return
+    if fd < 0:
+      return
+
+    # Params.put renames the new value into place, Params.remove and clear_all unlink it
+    if libc.inotify_add_watch(fd, params.get_param_path().encode(), IN_MOVED_TO | IN_DELETE) < 0:
+      os.close(fd)
+      return
+
+    self.watching = True
+    t = threading.Thread(target=self.watch, args=(fd, ))
+    t.daemon = True
+    t.start()
+
+  def check(self) -> bool:
+    self.ticks += 1
+    recheck = not self.watching or self.changed.is_set() or self.ticks % self.recheck_ticks == 0
+    if recheck:
+      # Cleared before the caller reads the params, so a write landing during the read sets it again
+      self.changed.clear()
+    return recheck
+
+  def watch(self, fd: int) -> None:
+    try:
+      while True:
+        buf = os.read(fd, 4096)
+        offset = 0
+        while offset < len(buf):
+          _, mask, _, name_len = INOTIFY_EVENT.unpack_from(buf, offset)
+          offset += INOTIFY_EVENT.size
+          name = buf[offset:offset + name_len].rstrip(b"\0").decode()
+          offset += name_len
+
+          # The watch is gone, e.g. the params directory was removed or replaced
+          if mask & IN_IGNORED:
+            return
+          if mask & IN_Q_OVERFLOW or name in self.keys:
+            self.changed.set()
+    except Exception:
+      cloudlog.exception("params watcher failed, falling back to polling")
+    finally:
+      # Whatever stopped the watch, make every following check poll the params
+      self.watching = False
+      self.changed.set()
+      os.close(fd)
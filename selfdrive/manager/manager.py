@@ -3,8 +3,9 @@ import datetime
 import os
 import signal
 import sys
+import time
 import traceback
-from typing import List, Tuple, Union
+from typing import Dict, List
 
 from cereal import log
 import cereal.messaging as messaging
@@ -14,7 +15,7 @@ from openpilot.common.params import Params, ParamKeyType
 from openpilot.common.text_window import TextWindow
 from openpilot.selfdrive.boardd.set_time import set_time
 from openpilot.system.hardware import HARDWARE, PC
-from openpilot.selfdrive.manager.helpers import unblock_stdout, write_onroad_params, save_bootlog
+from openpilot.selfdrive.manager.helpers import unblock_stdout, write_onroad_params, save_bootlog, ParamsWatcher
 from openpilot.selfdrive.manager.process import ensure_running
 from openpilot.selfdrive.manager.process_config import managed_processes
 from openpilot.selfdrive.athena.registration import register, UNREGISTERED_DONGLE_ID
@@ -27,6 +28,213 @@ from openpilot.selfdrive.frogpilot.functions.model_switcher import set_model
 
 PREBUILT_FILE = os.path.join(BASEDIR, 'prebuilt')
 
+# Params that make manager_thread exit when set
+EXIT_PARAMS = ("DoUninstall", "DoShutdown", "DoReboot")
+# Read the exit params at least this often even when no change was seen, ~5s at the deviceState rate
+EXIT_PARAMS_RECHECK_TICKS = 10
+
+DEFAULT_PARAMS: Dict[str, str] = {
+  "CompletedTrainingVersion": "0",
+  "DisengageOnAccelerator": "0",
+  "GsmMetered": "1",
+  "HasAcceptedTerms": "0",
+  "LanguageSetting": "main_en",
+  "OpenpilotEnabledToggle": "1",
+  "LongitudinalPersonality": str(log.LongitudinalPersonality.standard),
+
+  # Default FrogPilot parameters
+  "AccelerationPath": "1",
+  "AccelerationProfile": "2",
+  "AdjacentPath": "0",
+  "AdjacentPathMetrics": "0",
+  "AdjustablePersonalities": "1",
+  "AggressiveAcceleration": "1",
+  "AggressiveFollow": "12",
+  "AggressiveJerk": "5",
+  "AlwaysOnLateral": "1",
+  "AlwaysOnLateralMain": "0",
+  "BlindSpotPath": "1",
+  "CameraView": "0",
+  "CECurves": "1",
+  "CENavigation": "1",
+  "CESignal": "1",
+  "CESlowerLead": "0",
+  "CESpeed": "0",
+  "CESpeedLead": "0",
+  "CEStopLights": "1",
+  "CEStopLightsLead": "1",
+  "Compass": "0",
+  "ConditionalExperimental": "1",
+  "CurveSensitivity": "100",
+  "CustomColors": "1",
+  "CustomIcons": "1",
+  "CustomPersonalities": "1",
+  "CustomSignals": "1",
+  "CustomSounds": "1",
+  "CustomTheme": "1",
+  "CustomUI": "1",
+  "DeviceShutdown": "9",
+  "DriverCamera": "0",
+  "DriveStats": "1",
+  "EVTable": "1",
+  "ExperimentalModeActivation": "1",
+  "ExperimentalModeViaLKAS": "0",
+  "ExperimentalModeViaScreen": "1",
+  "Fahrenheit": "0",
+  "FireTheBabysitter": "0",
+  "FPSCounter": "0",
+  "FullMap": "0",
+  "GasRegenCmd": "0",
+  "GoatScream": "1",
+  "GreenLightAlert": "0",
+  "HideSpeed": "0",
+  "HideSpeedUI": "0",
+  "HigherBitrate": "0",
+  "LaneChangeTime": "0",
+  "LaneDetection": "1",
+  "LaneLinesWidth": "4",
+  "LateralTune": "1",
+  "LeadInfo": "0",
+  "LockDoors": "0",
+  "LongitudinalTune": "1",
+  "LongPitch": "1",
+  "LowerVolt": "1",
+  "MTSCAggressiveness": "100",
+  "Model": "0",
+  "ModelUI": "1",
+  "MTSCEnabled": "1",
+  "MuteDM": "0",
+  "MuteDoor": "0",
+  "MuteOverheated": "0",
+  "MuteSeatbelt": "0",
+  "NNFF": "1",
+  "NoLogging": "0",
+  "NudgelessLaneChange": "1",
+  "NumericalTemp": "0",
+  "Offset1": "5",
+  "Offset2": "5",
+  "Offset3": "5",
+  "Offset4": "10",
+  "OneLaneChange": "1",
+  "PathEdgeWidth": "20",
+  "PathWidth": "61",
+  "PauseLateralOnSignal": "0",
+  "PersonalitiesViaScreen": "1",
+  "PersonalitiesViaWheel": "1",
+  "PreferredSchedule": "0",
+  "QOLControls": "1",
+  "QOLVisuals": "1",
+  "RandomEvents": "0",
+  "RelaxedFollow": "18",
+  "RelaxedJerk": "10",
+  "ReverseCruise": "0",
+  "ReverseCruiseUI": "0",
+  "RoadEdgesWidth": "2",
+  "RoadNameUI": "1",
+  "RotatingWheel": "1",
+  "ScreenBrightness": "101",
+  "SearchInput": "0",
+  "SetSpeedOffset": "0",
+  "ShowCPU": "0",
+  "ShowGPU": "0",
+  "ShowMemoryUsage": "0",
+  "Sidebar": "0",
+  "SilentMode": "0",
+  "SLCFallback": "2",
+  "SLCOverride": "1",
+  "SLCPriority1": "1",
+  "SLCPriority2": "2",
+  "SLCPriority3": "3",
+  "SmoothBraking": "1",
+  "SNGHack": "1",
+  "SpeedLimitController": "1",
+  "StandardFollow": "15",
+  "StandardJerk": "10",
+  "StoppingDistance": "0",
+  "TSS2Tune": "1",
+  "TurnAggressiveness": "100",
+  "TurnDesires": "0",
+  "UnlimitedLength": "1",
+  "UseSI": "0",
+  "UseVienna": "0",
+  "VisionTurnControl": "1",
+  "WheelIcon": "3",
+}
+
+# Defaults that differ on the FrogPilot-Development branch
+FROGSGOMOO_PARAMS: Dict[str, str] = {
+  "CompletedTrainingVersion": "0.2.0",
+  "GsmMetered": "0",
+  "HasAcceptedTerms": "2",
+  "AccelerationProfile": "3",
+  "AdjacentPath": "1",
+  "AdjacentPathMetrics": "1",
+  "AggressiveFollow": "10",
+  "AggressiveJerk": "6",
+  "AlwaysOnLateralMain": "1",
+  "CameraView": "1",
+  "CEStopLightsLead": "0",
+  "Compass": "1",
+  "CurveSensitivity": "125",
+  "EVTable": "0",
+  "ExperimentalModeViaLKAS": "1",
+  "ExperimentalModeViaScreen": "0",
+  "FireTheBabysitter": "1",
+  "FPSCounter": "1",
+  "HigherBitrate": "1",
+  "LeadInfo": "1",
+  "LongPitch": "0",
+  "LowerVolt": "0",
+  "MTSCEnabled": "0",
+  "MuteDM": "1",
+  "MuteDoor": "1",
+  "MuteOverheated": "1",
+  "MuteSeatbelt": "1",
+  "NumericalTemp": "1",
+  "Offset2": "7",
+  "Offset3": "10",
+  "Offset4": "20",
+  "PersonalitiesViaScreen": "0",
+  "RandomEvents": "1",
+  "RelaxedFollow": "30",
+  "RelaxedJerk": "50",
+  "ShowCPU": "1",
+  "ShowMemoryUsage": "1",
+  "Sidebar": "1",
+  "SNGHack": "0",
+  "StoppingDistance": "3",
+  "TurnAggressiveness": "150",
+  "TurnDesires": "1",
+  "UseSI": "1",
+  "WheelIcon": "1",
+}
+DEFAULT_PARAMS_FROGSGOMOO = {**DEFAULT_PARAMS, **FROGSGOMOO_PARAMS}
+
+# Legacy "SLCPriority" values mapped to the "SLCPriority1-3" params
+SLC_PRIORITIES = ("None", "Dashboard", "Navigation", "Offline Maps", "Highest", "Lowest")
+SLC_PRIORITIES_MAPPING = {
+  1: ["Dashboard", "Navigation", "Offline Maps"],
+  2: ["Navigation", "Offline Maps", "Dashboard"],
+  3: ["Navigation", "Offline Maps", "None"],
+  4: ["Navigation", "Dashboard", "None"],
+  5: ["Navigation", "None", "None"],
+  6: ["Offline Maps", "Dashboard", "Navigation"],
+  7: ["Offline Maps", "Navigation", "Dashboard"],
+  8: ["Offline Maps", "Navigation", "None"],
+  9: ["Offline Maps", "Dashboard", "None"],
+  10: ["Offline Maps", "None", "None"],
+  11: ["Dashboard", "Navigation", "Offline Maps"],
+  12: ["Dashboard", "Offline Maps", "Navigation"],
+  13: ["Dashboard", "Offline Maps", "None"],
+  14: ["Dashboard", "Navigation", "None"],
+  15: ["Dashboard", "None", "None"],
+  16: ["Highest", "None", "None"],
+  17: ["Lowest", "None", "None"],
+  18: ["None", "None", "None"],
+}
+# Stored as indices into SLC_PRIORITIES, resolved once here instead of on every boot
+SLC_PRIORITY_INDICES = {k: tuple(SLC_PRIORITIES.index(p) for p in v) for k, v in SLC_PRIORITIES_MAPPING.items()}
+
 def manager_init() -> None:
   # update system time from panda
   set_time(cloudlog)
@@ -35,155 +243,36 @@ def manager_init() -> None:
   save_bootlog()
 
   # Clear the error log on boot to prevent old errors from hanging around
-  if os.path.isfile(os.path.join(sentry.CRASHES_DIR, 'error.txt')):
-    os.remove(os.path.join(sentry.CRASHES_DIR, 'error.txt'))
+  error_log = os.path.join(sentry.CRASHES_DIR, 'error.txt')
+  if os.path.isfile(error_log):
+    os.remove(error_log)
+
+  # Look up the git info once, the lookups with and without a default are cached separately
+  version = get_version()
+  commit = get_commit()
+  branch = get_short_branch()
+  origin = get_origin()
+  release_branch = is_release_branch()
 
   params = Params()
   params.clear_all(ParamKeyType.CLEAR_ON_MANAGER_START)
   params.clear_all(ParamKeyType.CLEAR_ON_ONROAD_TRANSITION)
   params.clear_all(ParamKeyType.CLEAR_ON_OFFROAD_TRANSITION)
-  if is_release_branch():
+  if release_branch:
     params.clear_all(ParamKeyType.DEVELOPMENT_ONLY)
 
-  FrogsGoMoo = get_short_branch() == "FrogPilot-Development"
-
-  default_params: List[Tuple[str, Union[str, bytes]]] = [
-    ("CompletedTrainingVersion", "0.2.0" if FrogsGoMoo else "0"),
-    ("DisengageOnAccelerator", "0"),
-    ("GsmMetered", "0" if FrogsGoMoo else "1"),
-    ("HasAcceptedTerms", "2" if FrogsGoMoo else "0"),
-    ("LanguageSetting", "main_en"),
-    ("OpenpilotEnabledToggle", "1"),
-    ("LongitudinalPersonality", str(log.LongitudinalPersonality.standard)),
-
-    # Default FrogPilot parameters
-    ("AccelerationPath", "1"),
-    ("AccelerationProfile", "3" if FrogsGoMoo else "2"),
-    ("AdjacentPath", "1" if FrogsGoMoo else "0"),
-    ("AdjacentPathMetrics", "1" if FrogsGoMoo else "0"),
-    ("AdjustablePersonalities", "1"),
-    ("AggressiveAcceleration", "1"),
-    ("AggressiveFollow", "10" if FrogsGoMoo else "12"),
-    ("AggressiveJerk", "6" if FrogsGoMoo else "5"),
-    ("AlwaysOnLateral", "1"),
-    ("AlwaysOnLateralMain", "1" if FrogsGoMoo else "0"),
-    ("BlindSpotPath", "1"),
-    ("CameraView", "1" if FrogsGoMoo else "0"),
-    ("CECurves", "1"),
-    ("CENavigation", "1"),
-    ("CESignal", "1"),
-    ("CESlowerLead", "0"),
-    ("CESpeed", "0"),
-    ("CESpeedLead", "0"),
-    ("CEStopLights", "1"),
-    ("CEStopLightsLead", "0" if FrogsGoMoo else "1"),
-    ("Compass", "1" if FrogsGoMoo else "0"),
-    ("ConditionalExperimental", "1"),
-    ("CurveSensitivity", "125" if FrogsGoMoo else "100"),
-    ("CustomColors", "1"),
-    ("CustomIcons", "1"),
-    ("CustomPersonalities", "1"),
-    ("CustomSignals", "1"),
-    ("CustomSounds", "1"),
-    ("CustomTheme", "1"),
-    ("CustomUI", "1"),
-    ("DeviceShutdown", "9"),
-    ("DriverCamera", "0"),
-    ("DriveStats", "1"),
-    ("EVTable", "0" if FrogsGoMoo else "1"),
-    ("ExperimentalModeActivation", "1"),
-    ("ExperimentalModeViaLKAS", "1" if FrogsGoMoo else "0"),
-    ("ExperimentalModeViaScreen", "0" if FrogsGoMoo else "1"),
-    ("Fahrenheit", "0"),
-    ("FireTheBabysitter", "1" if FrogsGoMoo else "0"),
-    ("FPSCounter", "1" if FrogsGoMoo else "0"),
-    ("FullMap", "0"),
-    ("GasRegenCmd", "0"),
-    ("GoatScream", "1"),
-    ("GreenLightAlert", "0"),
-    ("HideSpeed", "0"),
-    ("HideSpeedUI", "0"),
-    ("HigherBitrate", "1" if FrogsGoMoo else "0"),
-    ("LaneChangeTime", "0"),
-    ("LaneDetection", "1"),
-    ("LaneLinesWidth", "4"),
-    ("LateralTune", "1"),
-    ("LeadInfo", "1" if FrogsGoMoo else "0"),
-    ("LockDoors", "0"),
-    ("LongitudinalTune", "1"),
-    ("LongPitch", "0" if FrogsGoMoo else "1"),
-    ("LowerVolt", "0" if FrogsGoMoo else "1"),
-    ("MTSCAggressiveness", "100" if FrogsGoMoo else "100"),
-    ("Model", "0"),
-    ("ModelUI", "1"),
-    ("MTSCEnabled", "0" if FrogsGoMoo else "1"),
-    ("MuteDM", "1" if FrogsGoMoo else "0"),
-    ("MuteDoor", "1" if FrogsGoMoo else "0"),
-    ("MuteOverheated", "1" if FrogsGoMoo else "0"),
-    ("MuteSeatbelt", "1" if FrogsGoMoo else "0"),
-    ("NNFF", "1"),
-    ("NoLogging", "0"),
-    ("NudgelessLaneChange", "1"),
-    ("NumericalTemp", "1" if FrogsGoMoo else "0"),
-    ("Offset1", "5"),
-    ("Offset2", "7" if FrogsGoMoo else "5"),
-    ("Offset3", "10" if FrogsGoMoo else "5"),
-    ("Offset4", "20" if FrogsGoMoo else "10"),
-    ("OneLaneChange", "1"),
-    ("PathEdgeWidth", "20"),
-    ("PathWidth", "61"),
-    ("PauseLateralOnSignal", "0"),
-    ("PersonalitiesViaScreen", "0" if FrogsGoMoo else "1"),
-    ("PersonalitiesViaWheel", "1"),
-    ("PreferredSchedule", "0"),
-    ("QOLControls", "1"),
-    ("QOLVisuals", "1"),
-    ("RandomEvents", "1" if FrogsGoMoo else "0"),
-    ("RelaxedFollow", "30" if FrogsGoMoo else "18"),
-    ("RelaxedJerk", "50" if FrogsGoMoo else "10"),
-    ("ReverseCruise", "0"),
-    ("ReverseCruiseUI", "0"),
-    ("RoadEdgesWidth", "2"),
-    ("RoadNameUI", "1"),
-    ("RotatingWheel", "1"),
-    ("ScreenBrightness", "101"),
-    ("SearchInput", "0"),
-    ("SetSpeedOffset", "0"),
-    ("ShowCPU", "1" if FrogsGoMoo else "0"),
-    ("ShowGPU", "0"),
-    ("ShowMemoryUsage", "1" if FrogsGoMoo else "0"),
-    ("Sidebar", "1" if FrogsGoMoo else "0"),
-    ("SilentMode", "0"),
-    ("SLCFallback", "2"),
-    ("SLCOverride", "1"),
-    ("SLCPriority1", "1"),
-    ("SLCPriority2", "2"),
-    ("SLCPriority3", "3"),
-    ("SmoothBraking", "1"),
-    ("SNGHack", "0" if FrogsGoMoo else "1"),
-    ("SpeedLimitController", "1"),
-    ("StandardFollow", "15"),
-    ("StandardJerk", "10"),
-    ("StoppingDistance", "3" if FrogsGoMoo else "0"),
-    ("TSS2Tune", "1"),
-    ("TurnAggressiveness", "150" if FrogsGoMoo else "100"),
-    ("TurnDesires", "1" if FrogsGoMoo else "0"),
-    ("UnlimitedLength", "1"),
-    ("UseSI", "1" if FrogsGoMoo else "0"),
-    ("UseVienna", "0"),
-    ("VisionTurnControl", "1"),
-    ("WheelIcon", "1" if FrogsGoMoo else "3")
-  ]
+  FrogsGoMoo = branch == "FrogPilot-Development"
+
+  default_params: Dict[str, str] = DEFAULT_PARAMS_FROGSGOMOO if FrogsGoMoo else DEFAULT_PARAMS
   if not PC:
-    default_params.append(("LastUpdateTime", datetime.datetime.utcnow().isoformat().encode('utf8')))
+    default_params = {**default_params, "LastUpdateTime": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())}
 
   if params.get_bool("RecordFrontLock"):
     params.put_bool("RecordFront", True)
 
   # set unset params
-  for k, v in default_params:
-    if params.get(k) is None:
-      params.put(k, v)
+  missing_params = default_params.keys() - params.existing_keys()
+  params.put_many({k: default_params[k] for k in missing_params})
 
   # Remove this after the June 14th update
   previous_speed_limit = params.get_float("PreviousSpeedLimit")
@@ -192,51 +281,33 @@ def manager_init() -> None:
 
   slc_priority = params.get_int("SLCPriority")
   if slc_priority != 0:
-    priorities_mapping = {
-      1: ["Dashboard", "Navigation", "Offline Maps"],
-      2: ["Navigation", "Offline Maps", "Dashboard"],
-      3: ["Navigation", "Offline Maps", "None"],
-      4: ["Navigation", "Dashboard", "None"],
-      5: ["Navigation", "None", "None"],
-      6: ["Offline Maps", "Dashboard", "Navigation"],
-      7: ["Offline Maps", "Navigation", "Dashboard"],
-      8: ["Offline Maps", "Navigation", "None"],
-      9: ["Offline Maps", "Dashboard", "None"],
-      10: ["Offline Maps", "None", "None"],
-      11: ["Dashboard", "Navigation", "Offline Maps"],
-      12: ["Dashboard", "Offline Maps", "Navigation"],
-      13: ["Dashboard", "Offline Maps", "None"],
-      14: ["Dashboard", "Navigation", "None"],
-      15: ["Dashboard", "None", "None"],
-      16: ["Highest", "None", "None"],
-      17: ["Lowest", "None", "None"],
-      18: ["None", "None", "None"],
-    }
-
-    primary_priorities = ["None", "Dashboard", "Navigation", "Offline Maps", "Highest", "Lowest"]
-    old_priorities = priorities_mapping.get(slc_priority + 1, ["None", "None", "None"])
-
-    for i, priority in enumerate(old_priorities, start=1):
-      params.put_float(f"SLCPriority{i}", primary_priorities.index(priority))
-      params.put_int("SLCPriority", 0)
+    old_priorities = SLC_PRIORITY_INDICES.get(slc_priority + 1, (0, 0, 0))
+
+    # "%f" is what Params::putFloat stores via std::to_string(float), keep these in sync so get_float reads them back
+    slc_params = {f"SLCPriority{i}": f"{priority:f}" for i, priority in enumerate(old_priorities, start=1)}
+    slc_params["SLCPriority"] = "0"
+    params.put_many(slc_params)
 
   # Create folders needed for msgq
-  try:
-    os.mkdir("/dev/shm")
-  except FileExistsError:
-    pass
-  except PermissionError:
-    print("WARNING: failed to make /dev/shm")
-
-  # set version params
-  params.put("Version", get_version())
-  params.put("TermsVersion", terms_version)
-  params.put("TrainingVersion", training_version)
-  params.put("GitCommit", get_commit(default=""))
-  params.put("GitBranch", get_short_branch(default=""))
-  params.put("GitRemote", get_origin(default=""))
-  params.put_bool("IsTestedBranch", is_tested_branch())
-  params.put_bool("IsReleaseBranch", is_release_branch())
+  if not os.path.isdir("/dev/shm"):
+    try:
+      os.makedirs("/dev/shm", exist_ok=True)
+    except PermissionError:
+      print("WARNING: failed to make /dev/shm")
+
+  # set version params, skipping the ones that haven't changed since the last boot
+  version_params = {
+    "Version": version,
+    "TermsVersion": terms_version.decode('utf8'),
+    "TrainingVersion": training_version.decode('utf8'),
+    "GitCommit": commit or "",
+    "GitBranch": branch or "",
+    "GitRemote": origin or "",
+    "IsTestedBranch": "1" if is_tested_branch() else "0",
+    "IsReleaseBranch": "1" if release_branch else "0",
+  }
+  current_version_params = params.get_many(version_params.keys(), encoding='utf8')
+  params.put_many({k: v for k, v in version_params.items() if current_version_params[k] != v})
 
   # set dongle id
   reg_res = register(show_spinner=True)
@@ -247,17 +318,18 @@ def manager_init() -> None:
     raise Exception(f"Registration failed for device {serial}")
   os.environ['DONGLE_ID'] = dongle_id  # Needed for swaglog
 
-  if not is_dirty():
+  dirty = is_dirty()
+  if not dirty:
     os.environ['CLEAN'] = '1'
 
   # init logging
   sentry.init(sentry.SentryProject.SELFDRIVE)
   cloudlog.bind_global(dongle_id=dongle_id,
-                       version=get_version(),
+                       version=version,
                        origin=get_normalized_origin(),
-                       branch=get_short_branch(),
-                       commit=get_commit(),
-                       dirty=is_dirty(),
+                       branch=branch,
+                       commit=commit,
+                       dirty=dirty,
                        device=HARDWARE.get_device_type())
 
   # preimport all processes
@@ -296,11 +368,20 @@ def manager_thread() -> None:
   sm = messaging.SubMaster(['deviceState', 'carParams'], poll=['deviceState'])
   pm = messaging.PubMaster(['managerState'])
 
+  # managed_processes never changes while running, reuse one snapshot of it every iteration
+  procs = tuple(managed_processes.values())
+
   write_onroad_params(False, params)
-  ensure_running(managed_processes.values(), False, params=params, CP=sm['carParams'], not_run=ignore)
+  ensure_running(procs, False, params=params, CP=sm['carParams'], not_run=ignore)
 
   started_prev = False
 
+  # Only read the exit params again after one of them changed, falls back to polling without inotify
+  exit_params_watcher = ParamsWatcher(params, EXIT_PARAMS, EXIT_PARAMS_RECHECK_TICKS)
+
+  # Process names don't change, so only build their colored status strings once
+  status_names = [(p, f"\u001b[32m{p.name}\u001b[0m", f"\u001b[31m{p.name}\u001b[0m") for p in procs]
+
   while True:
     sm.update()
 
@@ -317,25 +398,28 @@ def manager_thread() -> None:
 
     started_prev = started
 
-    ensure_running(managed_processes.values(), started, params=params, CP=sm['carParams'], not_run=ignore)
+    ensure_running(procs, started, params=params, CP=sm['carParams'], not_run=ignore)
 
-    running = ' '.join("%s%s\u001b[0m" % ("\u001b[32m" if p.proc.is_alive() else "\u001b[31m", p.name)
-                       for p in managed_processes.values() if p.proc)
+    msg = messaging.new_message('managerState', valid=True)
+    msg.managerState.processes = [p.get_process_state_msg() for p in procs]
+
+    # The process states already hold whether each process is alive, don't poll them a second time
+    running = ' '.join(alive_name if state.running else dead_name
+                       for state, (p, alive_name, dead_name) in zip(msg.managerState.processes, status_names, strict=True) if p.proc)
     print(running)
     cloudlog.debug(running)
 
     # send managerState
-    msg = messaging.new_message('managerState', valid=True)
-    msg.managerState.processes = [p.get_process_state_msg() for p in managed_processes.values()]
     pm.send('managerState', msg)
 
     # Exit main loop when uninstall/shutdown/reboot is needed
     shutdown = False
-    for param in ("DoUninstall", "DoShutdown", "DoReboot"):
-      if params.get_bool(param):
-        shutdown = True
-        params.put("LastManagerExitReason", f"{param} {datetime.datetime.now()}")
-        cloudlog.warning(f"Shutting down manager - {param} set")
+    if exit_params_watcher.check():
+      for param, value in zip(EXIT_PARAMS, params.get_bools(EXIT_PARAMS), strict=True):
+        if value:
+          shutdown = True
+          params.put("LastManagerExitReason", f"{param} {datetime.datetime.now()}")
+          cloudlog.warning(f"Shutting down manager - {param} set")
 
     if shutdown:
       break
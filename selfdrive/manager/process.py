@@ -4,7 +4,7 @@ import signal
 import struct
 import time
 import subprocess
-from typing import Optional, Callable, List, ValuesView
+from typing import Optional, Callable, Iterable, List
 from abc import ABC, abstractmethod
 from multiprocessing import Process
 
@@ -163,7 +163,8 @@ class ManagerProcess(ABC):
       state.running = self.proc.is_alive()
       state.shouldBeRunning = self.proc is not None and not self.shutting_down
       state.pid = self.proc.pid or 0
-      state.exitCode = self.proc.exitcode or 0
+      # A running process has no exit code, skip polling it again
+      state.exitCode = 0 if state.running else (self.proc.exitcode or 0)
     return state
 
 
@@ -274,7 +275,7 @@ class DaemonProcess(ManagerProcess):
     pass
 
 
-def ensure_running(procs: ValuesView[ManagerProcess], started: bool, params=None, CP: car.CarParams=None,
+def ensure_running(procs: Iterable[ManagerProcess], started: bool, params=None, CP: car.CarParams=None,
                    not_run: Optional[List[str]]=None) -> List[ManagerProcess]:
   if not_run is None:
     not_run = []
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from openpilot.selfdrive.manager.helpers import ParamsWatcher
+
+KEYS = ("DoUninstall", "DoShutdown", "DoReboot")
+
+
+class FakeParams:
+  def __init__(self, path):
+    self.path = path
+
+  def get_param_path(self, key=""):
+    return os.path.join(self.path, key) if key else self.path
+
+
+class TestParamsWatcher(unittest.TestCase):
+  def setUp(self):
+    self.tmpdir = tempfile.mkdtemp()
+    self.params_path = os.path.join(self.tmpdir, "d")
+    os.mkdir(self.params_path)
+    self.watcher = ParamsWatcher(FakeParams(self.params_path), KEYS, recheck_ticks=1000)
+    self.assertTrue(self.watcher.watching)
+
+    # the first check always reads the params
+    self.assertTrue(self.watcher.check())
+    self.assertFalse(self.watcher.check())
+
+  def tearDown(self):
+    shutil.rmtree(self.tmpdir)
+
+  def _put(self, key, val="1"):
+    # write the same way Params.put does, a temp file renamed into place
+    tmp_path = os.path.join(self.tmpdir, ".tmp_value")
+    with open(tmp_path, "w") as f:
+      f.write(val)
+    os.rename(tmp_path, os.path.join(self.params_path, key))
+
+  def _wait_for_change(self, timeout=2.0):
+    self.assertTrue(self.watcher.changed.wait(timeout))
+
+  def test_rename(self):
+    self._put("DoReboot")
+    self._wait_for_change()
+    self.assertTrue(self.watcher.check())
+    self.assertFalse(self.watcher.check())
+
+  def test_unlink(self):
+    self._put("DoShutdown")
+    self._wait_for_change()
+    self.assertTrue(self.watcher.check())
+
+    os.unlink(os.path.join(self.params_path, "DoShutdown"))
+    self._wait_for_change()
+    self.assertTrue(self.watcher.check())
+
+  def test_ignored_key(self):
+    self._put("IsOnroad")
+    time.sleep(0.2)
+    self.assertFalse(self.watcher.check())
+
+  def test_watch_removed(self):
+    # replacing the params directory drops the watch, every check has to poll from then on
+    shutil.rmtree(self.params_path)
+    os.mkdir(self.params_path)
+    self._wait_for_change()
+    time.sleep(0.1)
+    self.assertFalse(self.watcher.watching)
+    for _ in range(3):
+      self.assertTrue(self.watcher.check())
+
+  def test_recheck_ticks(self):
+    watcher = ParamsWatcher(FakeParams(self.params_path), KEYS, recheck_ticks=3)
+    self.assertEqual([watcher.check() for _ in range(7)], [True, False, True, False, False, True, False])
+
+
+if __name__ == "__main__":
+  unittest.main()